@@ -10,13 +10,49 @@ __status__ = "development"
 __docformat__ = "reStructuredText"
 from ._version import __version__, __version_tuple__
 
-from .drawing import Drawing
-from .shapes import Line, Circle, Ellipse, Rect, Polyline, Polygon, EquilateralTriangle
-from .text import Text, TextPath
-from .image import Image
-from .containers import Group, ClipPath
-from .paths import Path, RawPath, MoveTo,MoveToDelta,LineTo,LineToDelta,PathLine,HlineTo,HlineToDelta,Hline,VlineTo,VlineToDelta,Vline,CubicBezierTo,CubicBezierToDelta,QuadraticBezierTo,QuadraticBezierToDelta
-from .units import mm, cm, m, inch
-from .transforms import Affine, identity
-from .svg import Versions
-from .attributes import FontStyle, FontVariant, FontStretch, FontWeight, FontSize, TextAnchor
\ No newline at end of file
+import importlib
+
+# Public names and the submodule that defines them.  The submodules are only
+# imported when one of their names is first used (PEP 562) so that, for
+# example, PIL isn't loaded unless an Image is needed.
+_LAZY = {
+    "Drawing": "drawing",
+    "Line": "shapes", "Circle": "shapes", "Ellipse": "shapes", "Rect": "shapes",
+    "Polyline": "shapes", "Polygon": "shapes", "EquilateralTriangle": "shapes",
+    "Text": "text", "TextPath": "text",
+    "Image": "image",
+    "Group": "containers", "ClipPath": "containers",
+    "Path": "paths", "RawPath": "paths", "MoveTo": "paths", "MoveToDelta": "paths",
+    "LineTo": "paths", "LineToDelta": "paths", "PathLine": "paths",
+    "HlineTo": "paths", "HlineToDelta": "paths", "Hline": "paths",
+    "VlineTo": "paths", "VlineToDelta": "paths", "Vline": "paths",
+    "CubicBezierTo": "paths", "CubicBezierToDelta": "paths",
+    "QuadraticBezierTo": "paths", "QuadraticBezierToDelta": "paths",
+    "mm": "units", "cm": "units", "m": "units", "inch": "units",
+    "Affine": "transforms", "identity": "transforms",
+    "Versions": "svg",
+    "FontStyle": "attributes", "FontVariant": "attributes", "FontStretch": "attributes",
+    "FontWeight": "attributes", "FontSize": "attributes", "TextAnchor": "attributes",
+    "LineCap": "attributes", "LineJoin": "attributes",
+}
+
+__all__ = list(_LAZY)
+
+# Submodules are also attributes of the package, e.g., schediazo.shapes.Rect.
+_SUBMODULES = ("drawing", "shapes", "text", "image", "containers", "paths", "units",
+               "transforms", "svg", "attributes", "align", "part")
+
+
+def __getattr__(name: str):
+    """Import the submodule defining a public name, or the submodule itself, on first access"""
+    if name in _LAZY:
+        value = getattr(importlib.import_module("." + _LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
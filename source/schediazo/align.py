@@ -2,7 +2,7 @@ from typing import List, Tuple, Union
 import math
 import numpy as np
 
-from .transforms import identity
+from .transforms import Affine, identity
 
 def two_point_align(xa: Union[List[float],Tuple,np.ndarray], ya: Union[List[float],Tuple,np.ndarray],
                     xb: Union[List[float],Tuple,np.ndarray], yb: Union[List[float],Tuple,np.ndarray],
@@ -30,67 +30,168 @@ def two_point_align(xa: Union[List[float],Tuple,np.ndarray], ya: Union[List[floa
     verbose : bool, optional
         Provide debugging information, by default False
     """
-    def cost(xa,ya,xb,yb,th):
-        tmp_x = (xa[0]-xa[1])*np.cos(th) - (ya[0]-ya[1])*np.sin(th) - xb[0] + xb[1]
-        tmp_y = (xa[0]-xa[1])*np.sin(th) + (ya[0]-ya[1])*np.cos(th) - yb[0] + yb[1]
-        rms = np.sqrt(tmp_x**2 + tmp_y**2)
-        return rms
-
-    def deriv(xa,ya,xb,yb,th):
-        tmp_x = (xa[0]-xa[1])*np.cos(th) - (ya[0]-ya[1])*np.sin(th) - xb[0] + xb[1]
-        tmp2_x = -(xa[0]-xa[1])*np.sin(th) - (ya[0]-ya[1])*np.cos(th)
-        tmp_y = (xa[0]-xa[1])*np.sin(th) + (ya[0]-ya[1])*np.cos(th) - yb[0] + yb[1]
-        tmp2_y = (xa[0]-xa[1])*np.cos(th) - (ya[0]-ya[1])*np.sin(th)
-        return 2*tmp_x*tmp2_x + 2*tmp_y*tmp2_y
-
-    # Find starting guess.
-    th = np.linspace(0.0, 2*math.pi, 360)
-    rms = cost(xa,ya,xb,yb,th)
-    this_th = th[np.argmin(rms)]
+    this_th = _solve_theta(float(xa[0]-xa[1]), float(ya[0]-ya[1]), float(xb[0]-xb[1]), float(yb[0]-yb[1]),
+                           max_iter, rate_drop, tolerance, verbose)
+
+    # Now we have the angle, find the translation
+    c, s = math.cos(this_th), math.sin(this_th)
+    tx = xb[0] - xa[0]*c + ya[0]*s
+    ty = yb[0] - xa[0]*s - ya[0]*c
+
+    # Now we have the rotation angle and the translation, construct an affine transform and
+    # return.
+    return identity().rotate(math.degrees(this_th)).translate(tx, ty)
+
+
+
+def two_point_align_many(xa: np.ndarray, ya: np.ndarray, xb: np.ndarray, yb: np.ndarray) -> List[Affine]:
+    """Solve Wahba's problem in 2D for many pairs of points at once
+
+    This is the vectorised equivalent of calling two_point_align for each row
+    of the inputs.  Because the rotation is found from the closed-form
+    solution, no gradient descent is needed.
+
+    Parameters
+    ----------
+    xa : np.ndarray
+        X coordinates for the point sets A, shape (N,2).
+    ya : np.ndarray
+        Y coordinates for the point sets A, shape (N,2).
+    xb : np.ndarray
+        X coordinates for the point sets B, shape (N,2).
+    yb : np.ndarray
+        Y coordinates for the point sets B, shape (N,2).
+
+    Returns
+    -------
+    List[Affine]
+        Transformation for each pair of points that takes A onto B.
+    """
+    xa, ya, xb, yb = (np.asarray(v, dtype=np.float64) for v in (xa, ya, xb, yb))
+    dx = xa[:,0] - xa[:,1]
+    dy = ya[:,0] - ya[:,1]
+    bx = xb[:,0] - xb[:,1]
+    by = yb[:,0] - yb[:,1]
+    th = np.mod(np.arctan2(dx*by - dy*bx, dx*bx + dy*by), 2*math.pi)
+
+    c = np.cos(th)
+    s = np.sin(th)
+    tx = xb[:,0] - xa[:,0]*c + ya[:,0]*s
+    ty = yb[:,0] - xa[:,0]*s - ya[:,0]*c
+
+    return [identity().rotate(thi).translate(txi, tyi) for thi, txi, tyi in zip(np.degrees(th).tolist(), tx.tolist(), ty.tolist())]
+
+
+
+def _cost_and_deriv(th: float, dx: float, dy: float, bx: float, by: float) -> Tuple[float,float]:
+    """Residual and its derivative for rotating vector (dx,dy) onto (bx,by)
+
+    Both share the rotated vector so are computed together.
+
+    Parameters
+    ----------
+    th : float
+        Rotation angle in radians.
+    dx : float
+        X component of the vector to rotate.
+    dy : float
+        Y component of the vector to rotate.
+    bx : float
+        X component of the target vector.
+    by : float
+        Y component of the target vector.
+
+    Returns
+    -------
+    Tuple[float,float]
+        Residual, and the derivative of the squared residual with respect to th.
+    """
+    c, s = math.cos(th), math.sin(th)
+    rot_x = dx*c - dy*s
+    rot_y = dx*s + dy*c
+    tmp_x = rot_x - bx
+    tmp_y = rot_y - by
+    return math.sqrt(tmp_x*tmp_x + tmp_y*tmp_y), 2*(tmp_y*rot_x - tmp_x*rot_y)
+
+
+
+def _solve_theta(dx: float, dy: float, bx: float, by: float,
+                    max_iter: int, rate_drop: float, tolerance: float, verbose: bool) -> float:
+    """Find the rotation angle that rotates vector (dx,dy) onto vector (bx,by)
+
+    All the arithmetic is done on Python floats with the math module since
+    the problem is only two-dimensional and NumPy temporaries dominate the cost.
+
+    Parameters
+    ----------
+    dx : float
+        X component of the vector between the two points in set A.
+    dy : float
+        Y component of the vector between the two points in set A.
+    bx : float
+        X component of the vector between the two points in set B.
+    by : float
+        Y component of the vector between the two points in set B.
+    max_iter : int
+        Maximum number of iterations.
+    rate_drop : float
+        How quickly that step is reduced as the algorithm moves towards a minimum.
+    tolerance : float
+        Tolerance for the solution minimum.
+    verbose : bool
+        Provide debugging information.
+
+    Returns
+    -------
+    float
+        Rotation angle in radians.
+    """
+    # Starting guess from the closed-form solution of the 2D problem, wrapped
+    # into [0,2pi).
+    this_th = math.atan2(dx*by - dy*bx, dx*bx + dy*by) % (2*math.pi)
     if verbose:
         print('starting guess {}'.format(this_th))
-        # plt.plot(th,rms)
-        # plt.show()
 
-    # Gradient descent step.
-    if np.abs(cost(xa,ya,xb,yb,this_th))<1e-7:
+    # Gradient descent step; stop as soon as the cost is negligible.
+    cost_floor = 1e-7
+    this_cost, this_deriv = _cost_and_deriv(this_th,dx,dy,bx,by)
+    if this_cost<cost_floor:
         done = True
     else:
         done = False
     iter = 0
-    rate = 1*np.pi/180.0
+    rate = 1*math.pi/180.0
     while iter<max_iter and not done:
 
         descended = False
         descend_check_iter=0
         while not descended and descend_check_iter<10:
-            dth = np.abs(deriv(xa,ya,xb,yb,this_th)*rate)
-            next_th = this_th - deriv(xa,ya,xb,yb,this_th)*rate
-            if cost(xa,ya,xb,yb,next_th)<cost(xa,ya,xb,yb,this_th):
+            dth = abs(this_deriv*rate)
+            next_th = this_th - this_deriv*rate
+            next_cost, next_deriv = _cost_and_deriv(next_th,dx,dy,bx,by)
+            if next_cost<this_cost:
                 descended = True
             else:
                 if verbose:
-                    print('finding best rate {}: this_th={} next_th={} rate={} cost(this_th)={} cost(next_th)={}'.format(descend_check_iter,this_th, next_th, rate, cost(xa,ya,xb,yb,this_th), cost(xa,ya,xb,yb,next_th)))
+                    print('finding best rate {}: this_th={} next_th={} rate={} cost(this_th)={} cost(next_th)={}'.format(descend_check_iter,this_th, next_th, rate, this_cost, next_cost))
                 rate /= 2.0
                 descend_check_iter += 1
 
-        if descend_check_iter==20:
-            raise ValueError
+        if not descended:
+            # The line search could not reduce the cost.  Starting from the
+            # closed-form solution this only happens at the minimum, where
+            # rounding in the derivative gives a spurious step, so keep this angle.
+            break
 
         if verbose:
-            print(iter, this_th, next_th, cost(xa,ya,xb,yb,next_th), dth/this_th)
+            print(iter, this_th, next_th, next_cost, dth)
 
         this_th = next_th
-        if np.abs(dth/this_th)<tolerance:
+        this_cost, this_deriv = next_cost, next_deriv
+        if this_cost<cost_floor or dth<tolerance*max(1.0,abs(this_th)):
             done = True
 
         rate *= rate_drop
         iter += 1
 
-    # Now we have the angle, find the translation
-    tx = xb[0] - xa[0]*np.cos(this_th) + ya[0]*np.sin(this_th)
-    ty = yb[0] - xa[0]*np.sin(this_th) - ya[0]*np.cos(this_th)
-
-    # Now we have the rotation angle and the translation, construct an affine transform and
-    # return.
-    return identity().rotate(np.degrees(this_th)).translate(tx, ty)
+    return this_th
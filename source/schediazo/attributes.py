@@ -3,15 +3,83 @@
 from __future__ import annotations
 import xml.etree.ElementTree as ET
 import enum
+import sys
 from typing import List, Union, Iterable
 
 from .transforms import Affine
 
 
+def _svg_str(value) -> str:
+    """Convert an attribute value into an interned SVG string
+
+    Enumerated values convert to their SVG keyword and interning means that
+    repeated colours, fonts, etc. share one object.
+
+    Parameters
+    ----------
+    value
+        Attribute value, e.g., a string, an enumerated value or None.
+
+    Returns
+    -------
+    str
+        The interned string, or None if the value was None.
+    """
+    if value is None:
+        return None
+    return sys.intern(str(value))
+
+
+
+def _opacity_str(value) -> str:
+    """Convert an opacity into an SVG string
+
+    Numbers are written compactly, e.g., 0.0 as "0", anything else, e.g., a
+    percentage string, is converted with str().
+
+    Parameters
+    ----------
+    value
+        Opacity, a number from 0.0 to 1.0 or a string, or None.
+
+    Returns
+    -------
+    str
+        The opacity string, or None if the value was None.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return format(value, 'g')
+    return str(value)
+
+
+
+class _StrEnum(str, enum.Enum):
+    """Enumeration whose members are the SVG keyword strings themselves
+    """
+    def __str__(self) -> str:
+        return self.value
+
+
 
 class AttributeBase:
     """Base mixin for element attributes
+
+    Each mixin lists the attributes it sets in _ATTRIBUTES as a tuple of
+    (instance attribute, SVG attribute, conversion to string).  When a class
+    is created the lists from all the mixins it inherits are joined, in method
+    resolution order, into a single plan so that writing an element is one
+    loop over the plan rather than a chain of super() calls through every mixin.
     """
+    _ATTRIBUTES = ()
+    _attribute_plan = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Build the attribute plan for this class.
+        """
+        super(AttributeBase, cls).__init_subclass__(**kwargs)
+        cls._attribute_plan = tuple(a for c in cls.__mro__ for a in c.__dict__.get('_ATTRIBUTES', ()))
 
     def set_element_attributes(self, element: Union[ET.Element,ET.SubElement]):
         """Set the attributes in the XML tree element
@@ -26,6 +94,13 @@ class AttributeBase:
         element : Union[ET.Element,ET.SubElement]
             The XML tree element that this method adds the attributes to.
         """
+        attrs = {}
+        for name, key, to_str in self._attribute_plan:
+            value = getattr(self, name)
+            if value is not None:
+                attrs[key] = to_str(value)
+        if attrs:
+            element.attrib.update(attrs)
         super(AttributeBase, self).set_element_attributes(element)
 
 
@@ -33,6 +108,9 @@ class AttributeBase:
 class Styling(AttributeBase):
     """Styling mixin for attributes style and class
     """
+    _ATTRIBUTES = (('_style', 'style', str),
+                   ('_cssclass', 'class', str))
+
     def __init__(self, style: str = None, cssclass: str = None, **kwargs):
         """Initialise
 
@@ -47,28 +125,12 @@ class Styling(AttributeBase):
         self._cssclass = cssclass
         super(Styling, self).__init__(**kwargs)
 
-    def set_element_attributes(self, element: Union[ET.Element,ET.SubElement]):
-        """Set the attributes in the XML tree element
-
-        Sets the attributes style and class in a tag, for example,
-        if this element corresponded to a tag "pentagon" it would set
-        <pentagon style="bbb" class="ccc"/>.
-
-        Parameters
-        ----------
-        element : Union[ET.Element,ET.SubElement]
-            The XML tree element that this method adds the attributes to.
-        """
-        if self._style is not None:
-            element.set('style', self._style)
-        if self._cssclass is not None:
-            element.set('class', self._cssclass)
-        super(Styling, self).set_element_attributes(element)
 
 
 class Transform(AttributeBase):
     """Mixin to store transform attribute
     """
+    _ATTRIBUTES = (('_transform', 'transform', str),)
 
     def __init__(self, transform: Affine=None, **kwargs):
         """Initialise
@@ -81,24 +143,9 @@ class Transform(AttributeBase):
         self._transform = transform
         super(Transform, self).__init__(**kwargs)
 
-    def set_element_attributes(self, element: Union[ET.Element,ET.SubElement]):
-        """Set the attributes in the XML tree element
-
-        Sets the transform attribute in the tag, for example,
-        if this element corresponded to a tag "pentagon" it would set
-        <pentagon transform="xxxx"/>.
-
-        Parameters
-        ----------
-        element : Union[ET.Element,ET.SubElement]
-            The XML tree element that this method adds the attributes to.
-        """
-        if self._transform is not None:
-            element.set('transform', str(self._transform))
-        super(Transform, self).set_element_attributes(element)
 
 
-class LineCap(enum.Enum):
+class LineCap(_StrEnum):
     """How the ends of strokes are drawn.
 
     Attributes
@@ -112,13 +159,13 @@ class LineCap(enum.Enum):
         The edge is rounded at the end of the line and extends beyond the end of
         the line by the stroke width.
     """
-    BUTT = enum.auto()
-    SQUARE = enum.auto()
-    ROUND = enum.auto()
+    BUTT = "butt"
+    SQUARE = "square"
+    ROUND = "round"
 
 
 
-class LineJoin(enum.Enum):
+class LineJoin(_StrEnum):
     """How to mitre joins in lines
 
     Attributes
@@ -134,17 +181,25 @@ class LineJoin(enum.Enum):
     ROUND
         There is a rounded cap at the join.
     """
-    ARC = enum.auto()
-    BEVEL = enum.auto()
-    MITER = enum.auto()
-    MITER_CLIP = enum.auto()
-    ROUND = enum.auto()
+    ARC = "arcs"
+    BEVEL = "bevel"
+    MITER = "miter"
+    MITER_CLIP = "miter-clip"
+    ROUND = "round"
 
 
 
 class Stroke(AttributeBase):
     """Stroke attributes to apply to a part outline.
     """
+    _ATTRIBUTES = (('_stroke', 'stroke', str),
+                   ('_stroke_dash_array', 'stroke-dasharray', str),
+                   ('_stroke_dash_offset', 'stroke-dashoffset', str),
+                   ('_stroke_linecap', 'stroke-linecap', str),
+                   ('_stroke_linejoin', 'stroke-linejoin', str),
+                   ('_stroke_miterlimit', 'stroke-miterlimit', str),
+                   ('_stroke_opacity', 'stroke-opacity', str),
+                   ('_stroke_width', 'stroke-width', str))
 
     def __init__(self, stroke: str = None,
                     stroke_dash_array: List[float] = None,
@@ -177,41 +232,24 @@ class Stroke(AttributeBase):
         stroke_width : float, optional
             Width of the stroke.
         """
-        self._stroke = stroke
-        self._stroke_dash_array = stroke_dash_array
-        self._stroke_dash_offset = stroke_dash_offset
-        self._stroke_linecap = stroke_linecap
-        self._stroke_linejoin = stroke_linejoin
-        self._stroke_miterlimit = stroke_miterlimit
-        self._stroke_opacity = stroke_opacity
-        self._stroke_width = stroke_width
+        # Everything is stored as its SVG string so nothing is formatted on output.
+        self._stroke = _svg_str(stroke)
+        self._stroke_dash_array = None if stroke_dash_array is None else ' '.join(map(str, stroke_dash_array))
+        self._stroke_dash_offset = _svg_str(stroke_dash_offset)
+        self._stroke_linecap = _svg_str(stroke_linecap)
+        self._stroke_linejoin = _svg_str(stroke_linejoin)
+        self._stroke_miterlimit = _svg_str(stroke_miterlimit)
+        self._stroke_opacity = _opacity_str(stroke_opacity)
+        self._stroke_width = _svg_str(stroke_width)
         super(Stroke, self).__init__(**kwargs)
 
-    def set_element_attributes(self, element: Union[ET.Element,ET.SubElement]):
-        """Set the attributes in the XML tree element
-
-        Sets the stroke attributes in the tag: "stroke", "stroke-dash-array",
-        "stroke-linecap", "stroke-linejoin", "stroke-miterlimit",
-        "stroke-opacity", and "stroke-width".
-
-        Parameters
-        ----------
-        element : Union[ET.Element,ET.SubElement]
-            The XML tree element that this method adds the attributes to.
-        """
-        if self._stroke is not None:
-            element.set('stroke', self._stroke)
-        if self._stroke_dash_array is not None:
-            element.set('stroke-dash-array', ''.join(['{} '.format(x) for x in self._stroke_dash_array]))
-        if self._stroke_width is not None:
-            element.set('stroke-width', str(self._stroke_width))
-        super(Stroke, self).set_element_attributes(element)
-
 
 
 class Fill(AttributeBase):
     """Mixing to store fill attributes
     """
+    _ATTRIBUTES = (('_fill', 'fill', str),
+                   ('_fill_opacity', 'fill-opacity', str))
 
     def __init__(self, fill: str = None,
                         fill_opacity: float = None, **kwargs):
@@ -224,31 +262,16 @@ class Fill(AttributeBase):
         fill_opacity : float, optional
             Opacity for the fill: 0.0 is fully transparent, 1.0 is fully opaque.
         """
-        self._fill = fill
-        self._fill_opacity = fill_opacity
+        self._fill = _svg_str(fill)
+        self._fill_opacity = _opacity_str(fill_opacity)
         super(Fill, self).__init__(**kwargs)
 
-    def set_element_attributes(self, element: Union[ET.Element,ET.SubElement]):
-        """Set the attributes in the XML tree element
-
-        Sets the fill attributes in the tag: "fill" and "fill-opacity".
-
-        Parameters
-        ----------
-        element : Union[ET.Element,ET.SubElement]
-            The XML tree element that this method adds the attributes to.
-        """
-        if self._fill is not None:
-            element.set('fill', self._fill)
-        if self._fill_opacity is not None:
-            element.set('fill-opacity', str(self._fill_opacity))
-        super(Fill, self).set_element_attributes(element)
-
 
 
 class Clip(AttributeBase):
     """Mixin to store clip path
     """
+    _ATTRIBUTES = (('_clip_path_url', 'clip-path', str),)
 
     def __init__(self, clip_path: str=None, **kwargs):
         """Initialise
@@ -259,25 +282,12 @@ class Clip(AttributeBase):
             ID of the part that is used as a clip path.
         """
         self._clip_path = clip_path
+        self._clip_path_url = None if clip_path is None else f'url(#{clip_path})'
         super(Clip, self).__init__(**kwargs)
 
-    def set_element_attributes(self, element: Union[ET.Element,ET.SubElement]):
-        """Set the attributes in the XML tree element
-
-        Sets the "clip-path" attribute in the tag.
-
-        Parameters
-        ----------
-        element : Union[ET.Element,ET.SubElement]
-            The XML tree element that this method adds the attributes to.
-        """
-        if self._clip_path is not None:
-            element.set('clip-path', 'url(#'+self._clip_path+')')
-        super(Clip, self).set_element_attributes(element)
-
 
 
-class FontStyle(enum.Enum):
+class FontStyle(_StrEnum):
     """Font styles
 
     Attributes
@@ -292,7 +302,7 @@ class FontStyle(enum.Enum):
 
 
 
-class FontVariant(enum.Enum):
+class FontVariant(_StrEnum):
     """Font variants
 
     Attributes
@@ -322,7 +332,7 @@ class FontVariant(enum.Enum):
 
 
 
-class FontStretch(enum.Enum):
+class FontStretch(_StrEnum):
     """Font stretch
 
     Attributes
@@ -349,7 +359,7 @@ class FontStretch(enum.Enum):
 
 
 
-class FontWeight(enum.Enum):
+class FontWeight(_StrEnum):
     """Font weight
 
     Attributes
@@ -366,7 +376,7 @@ class FontWeight(enum.Enum):
 
 
 
-class FontSize(enum.Enum):
+class FontSize(_StrEnum):
     """Font sizes
 
     Attributes
@@ -408,6 +418,12 @@ class FontSize(enum.Enum):
 class Font(AttributeBase):
     """Mixin to store font information
     """
+    _ATTRIBUTES = (('_font_family', 'font-family', str),
+                   ('_font_size', 'font-size', str),
+                   ('_font_stretch', 'font-stretch', str),
+                   ('_font_style', 'font-style', str),
+                   ('_font_variant', 'font-variant', str),
+                   ('_font_weight', 'font-weight', str))
 
     def __init__(self, font_family: str=None, font_size: Union[FontSize,str]=None, font_stretch: Union[FontStretch,str]=None,
                  font_style: FontStyle=None, font_variant: FontVariant=None, font_weight: Union[FontWeight,str]=None, **kwargs):
@@ -428,50 +444,18 @@ class Font(AttributeBase):
         font_weight : Union[FontWeight,str], optional
             Weight, can be a FontWeight, e.g., FontWeight.Bolder, or a size string, e.g., "900", by default None
         """
-        self._font_family = font_family
-        self._font_size = font_size
-        self._font_stretch = font_stretch
-        self._font_style = font_style
-        self._font_variant = font_variant
-        self._font_weight = font_weight
+        # Enumerated values are converted to their SVG strings up front.
+        self._font_family = _svg_str(font_family)
+        self._font_size = _svg_str(font_size)
+        self._font_stretch = _svg_str(font_stretch)
+        self._font_style = _svg_str(font_style)
+        self._font_variant = _svg_str(font_variant)
+        self._font_weight = _svg_str(font_weight)
         super(Font, self).__init__(**kwargs)
 
-    def set_element_attributes(self, element: Union[ET.Element,ET.SubElement]):
-        """Set the attributes in the XML tree element
 
-        Sets the font attributes in the tag.
 
-        Parameters
-        ----------
-        element : Union[ET.Element,ET.SubElement]
-            The XML tree element that this method adds the attributes to.
-        """
-        if self._font_family is not None:
-            element.set('font-family', self._font_family)
-        if self._font_size is not None:
-            if isinstance(self._font_size, FontSize):
-                element.set('font-size', self._font_size.value)
-            else:
-                element.set('font-size', self._font_size)
-        if self._font_stretch is not None:
-            if isinstance(self._font_stretch, FontStretch):
-                element.set('font-stretch', self._font_stretch.value)
-            else:
-                element.set('font-stretch', self._font_stretch)
-        if self._font_style is not None:
-            element.set('font-style', self._font_style.value)
-        if self._font_variant is not None:
-            element.set('font-variant', self._font_variant.value)
-        if self._font_weight is not None:
-            if isinstance(self._font_weight, FontWeight):
-                element.set('font-weight', self._font_weight.value)
-            else:
-                element.set('font-weight', self._font_weight)
-        super(Font, self).set_element_attributes(element)
-
-
-
-class TextAnchor(enum.Enum):
+class TextAnchor(_StrEnum):
     """Text anchoring
 
     Attributes
@@ -485,9 +469,29 @@ class TextAnchor(enum.Enum):
     End = "end"
 
 
+# SVG strings for each text anchor.
+_TEXT_ANCHOR_STRINGS = {a: a.value for a in TextAnchor}
+
+
+def _text_anchor_str(text_anchor: TextAnchor) -> str:
+    """Convert a text anchor to its SVG string
+
+    Raises
+    ------
+    ValueError
+        If the text anchor isn't a TextAnchor or one of its keywords.
+    """
+    try:
+        return _TEXT_ANCHOR_STRINGS[text_anchor]
+    except (KeyError, TypeError):
+        raise ValueError('invalid text anchor {!r}'.format(text_anchor)) from None
+
+
+
 class TextRendering(AttributeBase):
     """Mixin to store text rendering information
     """
+    _ATTRIBUTES = (('_text_anchor', 'text-anchor', str),)
 
     def __init__(self, text_anchor: TextAnchor=None, **kwargs):
         """Initialise
@@ -496,23 +500,11 @@ class TextRendering(AttributeBase):
         ----------
         text_anchor : TextAnchor, optional
             Anchor point for the for the string, e.g., middle, by default None (start).
-        """
-        self._text_anchor = text_anchor
-        super(TextRendering, self).__init__(**kwargs)
-
-    def set_element_attributes(self, element: Union[ET.Element,ET.SubElement]):
-        """Set the attributes in the XML tree element
 
-        Sets the text rendering attributes in the tag.
-
-        Parameters
-        ----------
-        element : Union[ET.Element,ET.SubElement]
-            The XML tree element that this method adds the attributes to.
+        Raises
+        ------
+        ValueError
+            If the text anchor isn't a TextAnchor.
         """
-        if self._text_anchor is not None:
-            if isinstance(self._text_anchor, TextAnchor):
-                element.set('text-anchor', self._text_anchor.value)
-            else:
-                raise ValueError
-        super(TextRendering, self).set_element_attributes(element)
+        self._text_anchor = None if text_anchor is None else _text_anchor_str(text_anchor)
+        super(TextRendering, self).__init__(**kwargs)
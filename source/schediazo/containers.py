@@ -13,16 +13,6 @@ class Group(Clip,PartDict):
         super(Group,self).__init__(**kwargs)
         self._tag = 'g'
 
-    def set_element_attributes(self, element: Union[ET.SubElement,ET.Element]):
-        """Set the SVG element attributes.
-
-        Parameters
-        ----------
-        element : Union[ET.SubElement,ET.Element]
-            Element to create the group under.
-        """
-        super(Group, self).set_element_attributes(element)
-
 
 
 class ClipPath(PartDict):
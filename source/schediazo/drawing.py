@@ -1,11 +1,6 @@
 """All the code for a top-level drawing"""
 from typing import Union
 import xml.etree.ElementTree as ET
-import gzip
-import copy
-
-import tinycss2
-import tinycss2.ast
 
 from .part import PartDict, PartBase
 from .svg import Versions
@@ -17,16 +12,6 @@ class Definitions(PartDict):
         super(Definitions,self).__init__()
         self._tag = 'defs'
 
-    def set_element_attributes(self, element: Union[ET.SubElement,ET.Element]):
-        """Set the SVG element attributes.
-
-        Parameters
-        ----------
-        element : Union[ET.SubElement,ET.Element]
-            Element to create the clip path under.
-        """
-        super(Definitions, self).set_element_attributes(element)
-
 
 class Drawing(PartDict):
     """Drawing
@@ -35,13 +20,13 @@ class Drawing(PartDict):
         self._root = None
         self._definitions = Definitions()
         self._styles = []
+        self._stylesheet = None
         super(Drawing, self).__init__(**kwargs)
 
-    def save(self, _filename: str, compressed: bool=False, version: Versions = Versions.SVG11):
-        self._root = ET.Element('svg')
-        self._root.set('xmlns', 'http://www.w3.org/2000/svg')
-        self._root.set('xmlns:xlink', 'http://www.w3.org/1999/xlink')
-        self._root.set('version', version.value)
+    def save(self, _filename: str, compressed: bool=False, version: Versions = Versions.SVG11, compresslevel: int=6):
+        self._root = ET.Element('svg', {'xmlns': 'http://www.w3.org/2000/svg',
+                                        'xmlns:xlink': 'http://www.w3.org/1999/xlink',
+                                        'version': version.value})
 
         # Get dimensions and set width and height.
         #     self._root.set('width', str(self._width))
@@ -54,28 +39,34 @@ class Drawing(PartDict):
 
         # Add the styles.
         if len(self._styles)>0:
+            if self._stylesheet is None:
+                import tinycss2
+                self._stylesheet = tinycss2.serialize(self._styles)
             element = ET.SubElement(self._root, "style")
-
-            sheet = []
-            for x in self._styles:
-                if not isinstance(x,(tinycss2.tokenizer.Comment,tinycss2.tokenizer.WhitespaceToken)):
-                    if isinstance(x,tinycss2.ast.QualifiedRule):
-                        tmp = copy.copy(x)
-                        tmp.prelude = [_x for _x in tmp.prelude if not isinstance(_x,(tinycss2.ast.Comment,tinycss2.ast.WhitespaceToken))]
-                        tmp.content = [_x for _x in tmp.content if not isinstance(_x,(tinycss2.ast.Comment,tinycss2.ast.WhitespaceToken))]
-                        sheet.append(tmp)
-            element.text = tinycss2.serialize(sheet)
+            element.text = self._stylesheet
 
         # Add the other objects.
         for child in self:
             self[child].create_element(self._root)
 
+        # Replace any .svg/.svgz extension with the one for this output, or add it.
+        lower = _filename.lower()
+        if lower.endswith('.svgz'):
+            _filename = _filename[:-5]
+        elif lower.endswith('.svg'):
+            _filename = _filename[:-4]
+        _filename += '.svgz' if compressed else '.svg'
+
+        # Serialise in one go so the file (or compressor) sees a single large write.
+#        ET.indent(self._root, space="\t", level=0)
+        data = ET.tostring(self._root)
         if compressed:
-            fh = gzip.open(_filename + '.svgz', mode='wb')
-            ET.ElementTree(self._root).write(fh)
+            import gzip
+            with gzip.open(_filename, mode='wb', compresslevel=compresslevel) as fh:
+                fh.write(data)
         else:
-#            ET.indent(self._root, space="\t", level=0)
-            ET.ElementTree(self._root).write(_filename + '.svg')
+            with open(_filename, mode='wb') as fh:
+                fh.write(data)
 
     def add_def(self, part: Union[PartBase,PartDict]):
         """Add a definition to the drawing.
@@ -95,4 +86,16 @@ class Drawing(PartDict):
         style_string : str
             Valid string of CSS.
         """
-        self._styles += tinycss2.parse_stylesheet(style_string)
+        import tinycss2
+        import tinycss2.ast
+
+        # Only the rules are kept, with comments and whitespace stripped, so
+        # that the stylesheet is ready to serialise when the drawing is saved.
+        skip = (tinycss2.ast.Comment,tinycss2.ast.WhitespaceToken)
+        rules = [x for x in tinycss2.parse_stylesheet(style_string, skip_comments=True, skip_whitespace=True)
+                    if isinstance(x,tinycss2.ast.QualifiedRule)]
+        for x in rules:
+            x.prelude = [_x for _x in x.prelude if not isinstance(_x,skip)]
+            x.content = [_x for _x in x.content if not isinstance(_x,skip)]
+        self._styles += rules
+        self._stylesheet = None
@@ -31,6 +31,7 @@ class Image(Transform,Clip,Styling,PartBase):
             Height of the image.
         image : PIL.Image.Image, optional
             Image object, if there's no href then the image will be embedded as a base64 encoded png.
+            A copy is taken, so later changes to the image are not drawn.
         href : str, optional
             If this is given then it takes priority over any PIL.Image.Image given.
         preserveAspectRatio : bool, optional
@@ -49,10 +50,16 @@ class Image(Transform,Clip,Styling,PartBase):
         self._width = width
         self._height = height
 
-        self._image = image
+        # Copy the image so that the encoded png cached on first write can't go stale.
+        self._image = image.copy() if image is not None else None
         self._href = href
+        self._encoded_image = None
 
         self._preserveAspectRatio = preserveAspectRatio
+
+        # These attributes don't change so are converted to strings once.
+        self._image_attributes = {'x': str(x), 'y': str(y), 'width': str(width), 'height': str(height),
+                                  'preserveAspectRatio': str(preserveAspectRatio)}
         super(Image,self).__init__(**kwargs)
         self._tag = 'image'
 
@@ -64,20 +71,18 @@ class Image(Transform,Clip,Styling,PartBase):
         element : Union[ET.Element,ET.SubElement]
             Element in which to set the 'x', 'w', 'width, 'height', 'preserveAspectRatio', 'href' and 'xlink:href' attributes.
         """
-        element.set('x', str(self._x))
-        element.set('y', str(self._y))
-        element.set('width', str(self._width))
-        element.set('height', str(self._height))
-        element.set('preserveAspectRatio', str(self._preserveAspectRatio))
+        element.attrib.update(self._image_attributes)
 
         if self._href is not None:
             element.set('href', self._href)
         else:
-            buffer = io.BytesIO()
-            self._image.save(buffer, format='png')
-            encoded_data = 'data:image/png;base64,'+str(base64.b64encode(buffer.getbuffer()), encoding='ascii')
-            element.set('xlink:href', encoded_data)
-            element.set('href', encoded_data)
+            # The image is only encoded the first time it is written.
+            if self._encoded_image is None:
+                buffer = io.BytesIO()
+                self._image.save(buffer, format='png')
+                self._encoded_image = 'data:image/png;base64,' + base64.b64encode(buffer.getbuffer()).decode('ascii')
+            element.set('xlink:href', self._encoded_image)
+            element.set('href', self._encoded_image)
 
         super(Image, self).set_element_attributes(element)
         return element
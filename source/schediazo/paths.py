@@ -8,6 +8,8 @@ from .part import PartBase
 class MoveTo:
     """Moves the position in absolute coordinates
     """
+    __slots__ = '_x', '_y'
+
     def __init__(self, x: float, y: float):
         """Initialise
 
@@ -46,6 +48,8 @@ class MoveTo:
 class MoveToDelta:
     """Moves the position in relative coordinates
     """
+    __slots__ = '_dx', '_dy'
+
     def __init__(self, dx: float, dy: float):
         """Initialise
 
@@ -84,6 +88,8 @@ class MoveToDelta:
 class LineTo:
     """Draws a line from the current position to an absolute position
     """
+    __slots__ = '_x', '_y'
+
     def __init__(self, x: float, y: float):
         """Initialise
 
@@ -122,6 +128,8 @@ class LineTo:
 class LineToDelta:
     """Draws a line from the current position to an relative position
     """
+    __slots__ = '_dx', '_dy'
+
     def __init__(self, dx: float, dy: float):
         """Initialise
 
@@ -160,6 +168,8 @@ class LineToDelta:
 class PathLine:
     """Draws a line from one position to another
     """
+    __slots__ = '_x0', '_y0', '_x1', '_y1'
+
     def __init__(self, x0: float, y0: float, x1: float, y1: float):
         """Initialise
 
@@ -204,6 +214,8 @@ class PathLine:
 class HlineTo:
     """Draws a horizontal line from the current position to an absolute position
     """
+    __slots__ = '_x'
+
     def __init__(self, x: float):
         """Initialise
 
@@ -239,6 +251,8 @@ class HlineTo:
 class HlineToDelta:
     """Draws a horizontal line from the current position to a relative position
     """
+    __slots__ = '_dx'
+
     def __init__(self, dx: float):
         """Initialise
 
@@ -273,6 +287,8 @@ class HlineToDelta:
 class Hline:
     """Draws a horizontal line from one absolute position to another absolute position
     """
+    __slots__ = '_x0', '_y', '_x1'
+
     def __init__(self, x0: float, y: float, x1: float):
         """Initialise
 
@@ -314,6 +330,8 @@ class Hline:
 class VlineTo:
     """Draws a vertical line from the current position to an absolute position
     """
+    __slots__ = '_y'
+
     def __init__(self, y: float):
         """Initialise
 
@@ -349,6 +367,8 @@ class VlineTo:
 class VlineToDelta:
     """Draws a vertical line from the current position to a relative position
     """
+    __slots__ = '_dy'
+
     def __init__(self, dy: float):
         """Initialise
 
@@ -383,6 +403,8 @@ class VlineToDelta:
 class Vline:
     """Draws a vertical line from one absolute position to another absolute position
     """
+    __slots__ = '_x', '_y0', '_y1'
+
     def __init__(self, x: float, y0: float, y1: float):
         """Initialise
 
@@ -424,6 +446,8 @@ class Vline:
 class CubicBezierTo:
     """Draw a cubic Bezier from the current position to a set of absolute coordinates.
     """
+    __slots__ = '_xc1', '_yc1', '_xc2', '_yc2', '_x', '_y'
+
 
     def __init__(self, xc1: float, yc1: float, xc2: float, yc2: float, x: float, y: float):
         """Initialise
@@ -475,6 +499,8 @@ class CubicBezierTo:
 class CubicBezierToDelta:
     """Draw a cubic Bezier from the current position to a set of relative coordinates.
     """
+    __slots__ = '_dxc1', '_dyc1', '_dxc2', '_dyc2', '_dx', '_dy'
+
 
     def __init__(self, dxc1: float, dyc1: float, dxc2: float, dyc2: float, dx: float, dy: float):
         """Initialise
@@ -526,6 +552,8 @@ class CubicBezierToDelta:
 class QuadraticBezierTo:
     """Draw a quadratic Bezier from the current position to a set of absolute coordinates.
     """
+    __slots__ = '_xc', '_yc', '_x', '_y'
+
 
     def __init__(self, xc: float, yc: float, x: float, y: float):
         """Initialise
@@ -571,6 +599,8 @@ class QuadraticBezierTo:
 class QuadraticBezierToDelta:
     """Draw a quadratic Bezier from the current position to a set of relative coordinates.
     """
+    __slots__ = '_dxc', '_dyc', '_dx', '_dy'
+
 
     def __init__(self, dxc: float, dyc: float, dx: float, dy: float):
         """Initialise
@@ -639,9 +669,11 @@ class RawPath(list):
         ValueError
             Exception if any item in the iterable is not a drawing command.
         """
-        for item in items:
-            if not isinstance(item, _COMMAND_CLASSES):
-                raise ValueError
+        if not isinstance(items, RawPath):
+            items = list(items)
+            for item in items:
+                if not isinstance(item, _COMMAND_CLASSES):
+                    raise ValueError
         super().__init__(items)
         self._closed = closed
 
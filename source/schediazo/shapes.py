@@ -7,6 +7,25 @@ from .attributes import Styling, Stroke, Fill, Transform, Clip
 from .part import PartBase
 from .paths import *
 
+
+def _points_string(x: np.ndarray, y: np.ndarray) -> str:
+    """Generate an SVG points string from arrays of vertex coordinates.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        x coordinates of the vertices.
+    y : np.ndarray
+        y coordinates of the vertices.
+
+    Returns
+    -------
+    str
+        Points string, e.g., "0,1 2,3 ".
+    """
+    return ''.join([f'{xi},{yi} ' for xi, yi in zip(x.tolist(), y.tolist())])
+
+
 class Line(Stroke,Transform,Clip,Styling,PartBase):
     """Line
     """
@@ -49,10 +68,8 @@ class Line(Stroke,Transform,Clip,Styling,PartBase):
         element : Union[ET.Element,ET.SubElement]
             Element in which to set the 'x1', 'y1', 'x2' and 'y2' attributes.
         """
-        element.set('x1', str(self._x1))
-        element.set('y1', str(self._y1))
-        element.set('x2', str(self._x2))
-        element.set('y2', str(self._y2))
+        element.attrib.update({'x1': str(self._x1), 'y1': str(self._y1),
+                               'x2': str(self._x2), 'y2': str(self._y2)})
         super(Line, self).set_element_attributes(element)
 
     def to_path(self) -> RawPath:
@@ -97,9 +114,7 @@ class Circle(Stroke,Fill,Transform,Clip,Styling,PartBase):
         element : Union[ET.Element,ET.SubElement]
             Element in which to set the 'cx', 'cy' and 'r' attributes.
         """
-        element.set('cx', str(self._cx))
-        element.set('cy', str(self._cy))
-        element.set('r', str(self._r))
+        element.attrib.update({'cx': str(self._cx), 'cy': str(self._cy), 'r': str(self._r)})
         super(Circle, self).set_element_attributes(element)
 
     def __repr__(self) -> str:
@@ -120,9 +135,9 @@ class Circle(Stroke,Fill,Transform,Clip,Styling,PartBase):
             Path representing the shape.
         """
         th = np.linspace(0, 2*np.pi, 32)
-        p = RawPath([MoveTo(self._cx + self._r*np.cos(th[0]), self._cy + self._r*np.sin(th[0]))], closed=True)
-        [p.append(LineTo(self._cx + self._r*np.cos(th[i]), self._cy + self._r*np.sin(th[i]))) for i in range(1,len(th))]
-        return p
+        x = self._cx + self._r*np.cos(th)
+        y = self._cy + self._r*np.sin(th)
+        return RawPath([MoveTo(x[0], y[0])]+[LineTo(x[i], y[i]) for i in range(1,len(th))], closed=True)
 
 
 class Ellipse(Stroke,Fill,Transform,Clip,Styling,PartBase):
@@ -158,10 +173,8 @@ class Ellipse(Stroke,Fill,Transform,Clip,Styling,PartBase):
         element : Union[ET.Element,ET.SubElement]
             Element in which to set the 'cx', 'cy', 'rx' and 'ry' attributes.
         """
-        element.set('cx', str(self._cx))
-        element.set('cy', str(self._cy))
-        element.set('rx', str(self._rx))
-        element.set('ry', str(self._ry))
+        element.attrib.update({'cx': str(self._cx), 'cy': str(self._cy),
+                               'rx': str(self._rx), 'ry': str(self._ry)})
         super(Ellipse, self).set_element_attributes(element)
 
     def __repr__(self) -> str:
@@ -182,9 +195,9 @@ class Ellipse(Stroke,Fill,Transform,Clip,Styling,PartBase):
             Path representing the shape.
         """
         th = np.linspace(0, 2*np.pi, 32)
-        p = RawPath([MoveTo(self._cx + self._rx*np.cos(th[0]), self._cy + self._ry*np.sin(th[0]))], closed=True)
-        [p.append(LineTo(self._cx + self._rx*np.cos(th[i]), self._cy + self._ry*np.sin(th[i]))) for i in range(1,len(th))]
-        return p
+        x = self._cx + self._rx*np.cos(th)
+        y = self._cy + self._ry*np.sin(th)
+        return RawPath([MoveTo(x[0], y[0])]+[LineTo(x[i], y[i]) for i in range(1,len(th))], closed=True)
 
 
 class Rect(Stroke,Fill,Transform,Clip,Styling,PartBase):
@@ -228,14 +241,13 @@ class Rect(Stroke,Fill,Transform,Clip,Styling,PartBase):
         element : Union[ET.Element,ET.SubElement]
             Element in which to set the 'x', 'y', 'w' and 'h' attributes.
         """
-        element.set('x', str(self._x))
-        element.set('y', str(self._y))
-        element.set('width', str(self._width))
-        element.set('height', str(self._height))
+        attrs = {'x': str(self._x), 'y': str(self._y),
+                 'width': str(self._width), 'height': str(self._height)}
         if self._rx is not None:
-            element.set('rx', str(self._rx))
+            attrs['rx'] = str(self._rx)
         if self._ry is not None:
-            element.set('ry', str(self._ry))
+            attrs['ry'] = str(self._ry)
+        element.attrib.update(attrs)
         super(Rect, self).set_element_attributes(element)
 
     def __repr__(self) -> str:
@@ -332,7 +344,7 @@ class Polyline(Stroke,Fill,Transform,Clip,Styling,PartBase):
         element : Union[ET.Element,ET.SubElement]
             Element in which to set the 'points' attribute.
         """
-        element.set('points', ''.join(['{},{} '.format(xi,yi) for xi,yi in zip(self._x,self._y)]))
+        element.set('points', _points_string(self._x, self._y))
         super(Polyline, self).set_element_attributes(element)
 
     def __repr__(self) -> str:
@@ -383,7 +395,7 @@ class Polygon(Stroke,Fill,Transform,Clip,Styling,PartBase):
         element : Union[ET.Element,ET.SubElement]
             Element in which to set the 'points' attribute.
         """
-        element.set('points', ''.join(['{},{} '.format(xi,yi) for xi,yi in zip(self._x,self._y)]))
+        element.set('points', _points_string(self._x, self._y))
         super(Polygon, self).set_element_attributes(element)
 
     def __repr__(self) -> str:
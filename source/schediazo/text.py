@@ -48,16 +48,18 @@ class Text(TextRendering,Stroke,Fill,Transform,Clip,Styling,Font,PartBase):
             Element in which to set the attributes.
         """
         element.text = self._text
+        attrs = {}
         if self._x is not None:
-            element.set('x', str(self._x))
+            attrs['x'] = str(self._x)
         if self._y is not None:
-            element.set('y', str(self._y))
+            attrs['y'] = str(self._y)
         if self._dx is not None:
-            element.set('dx', str(self._dx))
+            attrs['dx'] = str(self._dx)
         if self._dy is not None:
-            element.set('dy', str(self._dy))
+            attrs['dy'] = str(self._dy)
         if self._rotate is not None:
-            element.set('rotate', ''.join(['{} '.format(r) for r in self._rotate]))
+            attrs['rotate'] = ''.join([f'{r} ' for r in self._rotate])
+        element.attrib.update(attrs)
         super(Text, self).set_element_attributes(element)
 
 
@@ -118,13 +120,15 @@ class TextPath(TextRendering,Stroke,Fill,Transform,Clip,Styling,PartBase):
             Element in which to set the attributes.
         """
         element.text = self._text
+        attrs = {}
         if self._href is not None:
-            element.set('href', self._href)
+            attrs['href'] = self._href
         if self._side is not None:
-            element.set('side', self._side)
+            attrs['side'] = self._side
         if self._start_offset is not None:
-            element.set('startOffset', self._start_offset)
+            attrs['startOffset'] = self._start_offset
         if self._path is not None:
-            element.set('path', str(self._path))
+            attrs['path'] = str(self._path)
+        element.attrib.update(attrs)
         super(TextPath, self).set_element_attributes(element)
 
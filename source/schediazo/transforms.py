@@ -8,9 +8,12 @@ import numpy as np
 
 class Affine:
     """Affine (scaling/translation) transforms from (u,v) to (p,q)"""
+    __slots__ = '_matrix', '_operations', '_str'
+
     def __init__(self):
         self._matrix = None
         self._operations = []
+        self._str = None
 
     def __getitem__(self, index: int):
         """Directly get elements of the transformation matrix"""
@@ -25,8 +28,10 @@ class Affine:
         self._matrix[index] = value
 
     def __str__(self):
-        """Return an SVG-formatted string of transforms"""
-        return ''.join([str(op)+' ' for op in self._operations])
+        """Return an SVG-formatted string of transforms, cached until another operation is added"""
+        if self._str is None:
+            self._str = ''.join([str(op)+' ' for op in self._operations])
+        return self._str
 
     def __call__(self, u: Union[float,List,np.ndarray,Tuple], v: Union[float,List,np.ndarray,Tuple]):
         return self.transform(u, v)
@@ -63,59 +68,57 @@ class Affine:
         for op in self._operations:
             self._matrix = np.matmul(self._matrix, op.matrix)
 
+    def _add_operation(self, op):
+        """Prepend an operation and clear the cached SVG string"""
+        self._operations.insert(0,op)
+        self._str = None
+        return self
+
     def skewX(self, angle: float):
         """Add a X-axis skew transformation"""
-        self._operations.insert(0,SkewX(angle))
-        return self
+        return self._add_operation(SkewX(angle))
 
     def skewY(self, angle: float):
         """Add a Y-axis skew transformation"""
-        self._operations.insert(0,SkewY(angle))
-        return self
+        return self._add_operation(SkewY(angle))
 
     def rotate(self, angle: float, x: float=None, y: float=None):
         """Add a rotation transformation"""
-        self._operations.insert(0,Rotate(angle, x=x, y=y))
-        return self
+        return self._add_operation(Rotate(angle, x=x, y=y))
 
     def translate(self, tx: float, ty: float):
         """Add a translation transformation"""
-        self._operations.insert(0,Translate(tx, ty))
-        return self
+        return self._add_operation(Translate(tx, ty))
 
     def scale(self, sx: float, sy: float):
         """Add a scale transformation"""
-        self._operations.insert(0,Scale(sx,sy))
-        return self
+        return self._add_operation(Scale(sx,sy))
 
     def shear(self, sx: float, sy: float):
         """Add a shear transformation"""
-        self._operations.insert(0,Shear(sx,sy))
-        return self
+        return self._add_operation(Shear(sx,sy))
 
     def reflect(self):
         """Add a reflection (about both axes) transformation"""
-        self._operations.insert(0,Reflect())
-        return self
+        return self._add_operation(Reflect())
 
     def reflectX(self):
         """Add an X-axis reflection transformation"""
-        self._operations.insert(0,ReflectX())
-        return self
+        return self._add_operation(ReflectX())
 
     def reflectY(self):
         """Add a Y-axis reflection transformation"""
-        self._operations.insert(0,ReflectY())
-        return self
+        return self._add_operation(ReflectY())
 
     def sixmatrix(self, a: float, b: float, c: float, d: float, e: float, f: float):
         """Add an arbitrary transformation matrix"""
-        self._operations.insert(0,SixMatrix(a, b, c, d, e, f))
-        return self
+        return self._add_operation(SixMatrix(a, b, c, d, e, f))
 
 
 class SkewX:
     """X-axis skew transformation"""
+    __slots__ = '_angle',
+
     def __init__(self, angle: float):
         self._angle = angle
 
@@ -129,6 +132,8 @@ class SkewX:
 
 class SkewY:
     """Y-axis skew transformation"""
+    __slots__ = '_angle',
+
     def __init__(self, angle: float):
         self._angle = angle
 
@@ -142,6 +147,8 @@ class SkewY:
 
 class Translate:
     """Translation transformation"""
+    __slots__ = '_x', '_y'
+
     def __init__(self, x: float, y: float):
         self._x = x
         self._y = y
@@ -156,6 +163,8 @@ class Translate:
 
 class Scale:
     """Scale transformation"""
+    __slots__ = '_sx', '_sy'
+
     def __init__(self, sx: float, sy: float):
         self._sx = sx
         self._sy = sy
@@ -170,6 +179,8 @@ class Scale:
 
 class Rotate:
     """Rotation transformation"""
+    __slots__ = '_x', '_y', '_angle'
+
     def __init__(self, angle: float, x: float=None, y: float=None):
         if (x is not None) != (y is not None):
              raise ValueError
@@ -193,6 +204,8 @@ class Rotate:
 
 class Shear:
     """Shear transformation"""
+    __slots__ = '_sx', '_sy'
+
     def __init__(self, sx: float, sy: float):
         self._sx = sx
         self._sy = sy
@@ -211,24 +224,32 @@ class Shear:
 
 class Reflect(Scale):
     """Reflection transformation about all axes"""
+    __slots__ = ()
+
     def __init__(self):
         super(Reflect,self).__init__(-1.0,-1.0)
 
 
 class ReflectX(Scale):
     """Reflection transformation about X axis"""
+    __slots__ = ()
+
     def __init__(self):
         super(ReflectX,self).__init__(-1.0,1.0)
 
 
 class ReflectY(Scale):
     """Reflection transformation about Y axis"""
+    __slots__ = ()
+
     def __init__(self):
         super(ReflectY,self).__init__(1.0,-1.0)
 
 
 class SixMatrix:
     """Specify matrix transformation from six parameters"""
+    __slots__ = '_matrix',
+
     def __init__(self, a: float, b: float, c: float, d: float, e: float, f: float):
         self._matrix = np.array([[a, c, e], [b, d, f], [0, 0, 1]])
 
@@ -245,6 +266,8 @@ class SixMatrix:
 
 class GdalTransform(SixMatrix):
     """Specify matrix transformation from GDAL geom parameters"""
+    __slots__ = ()
+
     def __init__(self, geom: Union[List,Tuple,np.ndarray]):
         super(GdalTransform, self).__init__(geom[1], geom[4], geom[2], geom[5], geom[0], geom[3])
 
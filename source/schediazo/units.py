@@ -1,6 +1,12 @@
 """Unit conversions from various dimensions into points"""
 
 class UnitConversion:
+	"""Scale factor from a length unit into points
+
+	Multiplying a number by a conversion, e.g., 25*mm, returns a plain float
+	in points.  No units are carried around with the result so these are as
+	cheap as a float multiply and there is nothing worth caching.
+	"""
 	def __init__(self, m):
 		self._scale = m*72/25.4e-3
 
@@ -1,5 +1,7 @@
 import unittest
 import copy
+import contextlib
+import io
 
 import numpy as np
 import matplotlib.pyplot as plt
@@ -51,5 +53,46 @@ class TestAlign(unittest.TestCase):
             ax.set_aspect('equal')
             plt.show()
 
+    def test_many(self):
+        rng = np.random.default_rng(42)
+        xa = rng.uniform(-10, 10, (5,2))
+        ya = rng.uniform(-10, 10, (5,2))
+        th = rng.uniform(0, 2*np.pi, 5)
+        xb = np.cos(th)[:,None]*xa - np.sin(th)[:,None]*ya + 3.0
+        yb = np.sin(th)[:,None]*xa + np.cos(th)[:,None]*ya - 1.0
+
+        affs = schediazo.align.two_point_align_many(xa, ya, xb, yb)
+        self.assertEqual(len(affs), 5)
+        for i, aff in enumerate(affs):
+            single = schediazo.align.two_point_align(xa[i], ya[i], xb[i], yb[i])
+            self.assertAlmostEqual(aff._operations[1]._angle, single._operations[1]._angle, 6)
+            x, y = aff.transform(xa[i], ya[i])
+            np.testing.assert_allclose(x, xb[i], atol=1e-9)
+            np.testing.assert_allclose(y, yb[i], atol=1e-9)
+
+    def test_verbose_zero_angle(self):
+        # Parallel vectors of different lengths start the descent at (or next to) an angle of
+        # zero, and rounding in the derivative can then take a step away from zero.
+        for xa, ya, xb, yb, start in [([1133.24,0], [242.35,0], [3216.20,0], [687.80,0], 'starting guess 6.28318'),
+                                      ([-3393.48,0], [4699.25,0], [-10180.44,0], [14097.75,0], 'starting guess 0.0')]:
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                aff = schediazo.align.two_point_align(xa, ya, xb, yb, verbose=True)
+            self.assertAlmostEqual((aff._operations[1]._angle+180.0)%360.0-180.0, 0.0, 3)
+
+            # The progress output is written without dividing by the angle.
+            lines = out.getvalue().splitlines()
+            self.assertTrue(lines[0].startswith(start))
+            self.assertNotIn('inf', out.getvalue())
+
+    def test_large_separation(self):
+        # At large scales the line search can't improve on the closed-form start.
+        xa, ya = [-27111625,-18890132], [-1747721,-4221904]
+        xb, yb = [2136430,2173219], [21178388,-11120208]
+        aff = schediazo.align.two_point_align(xa, ya, xb, yb)
+        th = np.arctan2((xa[0]-xa[1])*(yb[0]-yb[1]) - (ya[0]-ya[1])*(xb[0]-xb[1]),
+                        (xa[0]-xa[1])*(xb[0]-xb[1]) + (ya[0]-ya[1])*(yb[0]-yb[1]))
+        self.assertAlmostEqual(np.radians(aff._operations[1]._angle), np.mod(th, 2*np.pi), 6)
+
 if __name__=='__main__':
     unittest.main()
\ No newline at end of file
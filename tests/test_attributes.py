@@ -0,0 +1,32 @@
+import unittest
+import xml.etree.ElementTree as ET
+
+import schediazo.shapes
+import schediazo.text
+from schediazo.attributes import FontStyle, TextAnchor
+
+class TestAttributes(unittest.TestCase):
+
+    def test_mixins(self):
+        t = schediazo.text.Text("Hello", x=1, y=2, text_anchor=TextAnchor.Middle, stroke='black', fill='red',
+                                clip_path='clip', cssclass='c', font_family='serif', font_style=FontStyle.Italic, id='t')
+        element = ET.Element('text')
+        t.set_element_attributes(element)
+        self.assertEqual(list(element.keys()), ['x', 'y', 'text-anchor', 'stroke', 'fill', 'clip-path',
+                                                'class', 'font-family', 'font-style', 'id'])
+        self.assertEqual(element.get('clip-path'), 'url(#clip)')
+        self.assertEqual(element.get('font-style'), 'italic')
+
+    def test_no_attributes(self):
+        r = schediazo.shapes.Rect(0, 0, 1, 1, id='r')
+        element = ET.Element('rect')
+        r.set_element_attributes(element)
+        self.assertEqual(dict(element.attrib), {'x': '0', 'y': '0', 'width': '1', 'height': '1', 'id': 'r'})
+
+    def test_text_anchor(self):
+        with self.assertRaises(ValueError):
+            schediazo.text.Text("Hello", text_anchor='somewhere')
+
+
+if __name__ == '__main__':
+    unittest.main()
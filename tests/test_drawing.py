@@ -0,0 +1,57 @@
+import unittest
+import gzip
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+
+import schediazo.drawing
+import schediazo.shapes
+
+class TestStyles(unittest.TestCase):
+
+    def test_add_style(self):
+        d = schediazo.drawing.Drawing()
+        d.add_style('/* comment */ .thick { stroke-width: 5px; } @import url(x.css);')
+        self.assertEqual(len(d._styles), 1)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'styles')
+            d.save(filename)
+            d.save(filename)
+            root = ET.parse(filename + '.svg').getroot()
+        self.assertEqual(root.find('{http://www.w3.org/2000/svg}style').text, '.thick{stroke-width:5px;}')
+
+        d.add_style('.thin { stroke-width: 1px; }')
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'styles')
+            d.save(filename)
+            root = ET.parse(filename + '.svg').getroot()
+        self.assertEqual(root.find('{http://www.w3.org/2000/svg}style').text, '.thick{stroke-width:5px;}.thin{stroke-width:1px;}')
+
+class TestSave(unittest.TestCase):
+
+    def test_compressed(self):
+        d = schediazo.drawing.Drawing()
+        d.add(schediazo.shapes.Circle(1, 2, 3, id='c'))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'circle')
+            d.save(filename, compressed=True, compresslevel=1)
+            with gzip.open(filename + '.svgz') as fh:
+                root = ET.parse(fh).getroot()
+        self.assertEqual(root.find('{http://www.w3.org/2000/svg}circle').get('id'), 'c')
+
+    def test_extension(self):
+        d = schediazo.drawing.Drawing()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            d.save(os.path.join(tmp, 'a'))
+            d.save(os.path.join(tmp, 'b.svg'))
+            d.save(os.path.join(tmp, 'c.svgz'), compressed=True)
+            d.save(os.path.join(tmp, 'd.svg'), compressed=True)
+            d.save(os.path.join(tmp, 'e.svgz'))
+            d.save(os.path.join(tmp, 'f.SVG'))
+            self.assertEqual(sorted(os.listdir(tmp)), ['a.svg', 'b.svg', 'c.svgz', 'd.svgz', 'e.svg', 'f.svg'])
+
+if __name__ == '__main__':
+    unittest.main()
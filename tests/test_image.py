@@ -0,0 +1,28 @@
+import unittest
+import xml.etree.ElementTree as ET
+
+import PIL.Image
+
+import schediazo.image
+
+class TestImage(unittest.TestCase):
+
+    def test_encoded_once(self):
+        image = schediazo.image.Image(0, 0, 10, 10, image=PIL.Image.new('RGB', (2, 2), 'red'))
+        first = image.create_element(ET.Element('svg'))
+        second = image.create_element(ET.Element('svg'))
+        self.assertTrue(first.get('href').startswith('data:image/png;base64,'))
+        self.assertEqual(first.get('href'), second.get('href'))
+        self.assertIs(first.get('href'), second.get('href'))
+
+    def test_image_copied(self):
+        picture = PIL.Image.new('RGB', (2, 2), 'red')
+        image = schediazo.image.Image(0, 0, 10, 10, image=picture)
+        before = image.create_element(ET.Element('svg')).get('href')
+        picture.putpixel((0, 0), (0, 0, 255))
+        after = image.create_element(ET.Element('svg')).get('href')
+        self.assertEqual(before, after)
+        self.assertEqual(image._image.getpixel((0, 0)), (255, 0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
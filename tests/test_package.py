@@ -0,0 +1,20 @@
+import unittest
+import subprocess
+import sys
+
+import schediazo
+
+class TestPackage(unittest.TestCase):
+
+    def test_submodules(self):
+        # Run in a fresh interpreter so that no other test has imported the submodules already;
+        # part is checked first since the other submodules import it.
+        code = 'import schediazo; schediazo.part.PartDict; schediazo.shapes.Rect; schediazo.drawing.Drawing(); schediazo.align'
+        subprocess.run([sys.executable, '-c', code], check=True)
+
+        self.assertIs(schediazo.shapes.Rect, schediazo.Rect)
+        with self.assertRaises(AttributeError):
+            schediazo.nonexistent
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+import xml.etree.ElementTree as ET
+
+import schediazo.shapes
+from schediazo.part import PartDict
+
+class TestExtend(unittest.TestCase):
+
+    def test_extend(self):
+        polygons = [schediazo.shapes.Polygon(x, y, fill='red') for x, y in [([0, 1, 0], [0, 0, 1]), ([5, 6, 5], [5, 5, 6])]]
+
+        d = PartDict()
+        d.extend(polygons)
+        self.assertEqual([x for x in d], [p.id for p in polygons])
+
+class TestPolygon(unittest.TestCase):
+
+    def test_points(self):
+        p = schediazo.shapes.Polygon([200, 250, 300], [100, 125, 150])
+        element = ET.Element('polygon')
+        p.set_element_attributes(element)
+        self.assertEqual(element.get('points'), '200,100 250,125 300,150 ')
+        self.assertTrue(str(p.to_path()).startswith('M 200 100 L 250 125'))
+
+        p = schediazo.shapes.Polygon([200, 250, 300.5], [100, 125, 150])
+        p.set_element_attributes(element)
+        self.assertEqual(element.get('points'), '200.0,100 250.0,125 300.5,150 ')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -56,6 +56,13 @@ class TestAffine(unittest.TestCase):
 		self.assertAlmostEqual(p, 120)
 		self.assertAlmostEqual(q, 170)
 
+	def test_str_cache(self):
+		aff = schediazo.transforms.identity().translate(1.0,2.0)
+		self.assertEqual(str(aff), 'translate(1.0 2.0) ')
+		self.assertIs(str(aff), str(aff))
+		aff.rotate(90.0)
+		self.assertEqual(str(aff), 'rotate(90.0) translate(1.0 2.0) ')
+
 
 
 if __name__ == '__main__':